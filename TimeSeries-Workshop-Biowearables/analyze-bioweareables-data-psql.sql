@@ -91,29 +91,8 @@ CREATE TABLE wearable_devices(
 
 
 -- ============================================================================
--- ## Create Indexes
+-- ## Configure Sparse Indexes
 -- ============================================================================
--- Indexes are used to speed up the retrieval of data from a database table.
--- In this case, you create an index on the device_id column of the health_data 
--- table. Hypertables automatically create indexes on the
--- time column, so you don't need to create an index on that column.
-
-
-CREATE INDEX ON health_data (device_id, time);
-CREATE INDEX ON health_data (heart_rate, time DESC);
-CREATE INDEX ON health_data (blood_pressure_systolic, time DESC);
-
-
--- If you have sparse data, with columns that are often NULL, 
--- you can add a clause to the index, saying WHERE column IS NOT NULL. 
--- This prevents the index from indexing NULL data, 
--- which can lead to a more compact and efficient index.
-
-
-CREATE INDEX ON health_data (blood_pressure_systolic, time DESC)
-  WHERE blood_pressure_systolic IS NOT NULL;
-
-
 -- Configurable sparse indexes: 
 -- lightweight metadata structures created on compressed chunks
 -- to allow efficient filtering without needing full B-tree indexes.
@@ -211,6 +190,31 @@ SELECT
 FROM generate_series(now() - interval '30 days', now(), interval '5 second') AS g1(time),
 generate_series(1, 4, 1) AS g2(device_id);  -- adjust interval eg '30 days' to generate larger dataset
 
+
+-- ============================================================================
+-- ## Create Indexes
+-- ============================================================================
+-- Indexes are used to speed up the retrieval of data from a database table.
+-- In this case, you create an index on the device_id column of the health_data 
+-- table. Hypertables automatically create indexes on the
+-- time column, so you don't need to create an index on that column.
+
+
+CREATE INDEX ON health_data (device_id, time);
+CREATE INDEX ON health_data (heart_rate, time DESC);
+CREATE INDEX ON health_data (blood_pressure_systolic, time DESC);
+
+
+-- If you have sparse data, with columns that are often NULL, 
+-- you can add a clause to the index, saying WHERE column IS NOT NULL. 
+-- This prevents the index from indexing NULL data, 
+-- which can lead to a more compact and efficient index.
+
+
+CREATE INDEX ON health_data (blood_pressure_systolic, time DESC)
+  WHERE blood_pressure_systolic IS NOT NULL;
+
+
 -- ============================================================================
 -- ## Verify the simulated health dataset
 -- ============================================================================
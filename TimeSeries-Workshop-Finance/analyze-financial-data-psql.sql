@@ -84,17 +84,6 @@ CREATE TABLE crypto_assets (
     "name" TEXT
 );
 
--- ============================================================================
--- ## Create Indexes
--- ============================================================================
--- Indexes are used to speed up the retrieval of data from a database table.
--- In this case, you create an index on the symbol column of the crypto_assets 
--- and crypto_ticks tables. Hypertables automatically create indexes on the 
--- time column, so you don't need to create an index on that column.
-
-CREATE INDEX ON crypto_assets (symbol);
-CREATE INDEX ON crypto_ticks (symbol, time);
-
 -- ============================================================================
 -- ## Load Financial Data
 -- ============================================================================
@@ -112,6 +101,17 @@ CREATE INDEX ON crypto_ticks (symbol, time);
 \COPY crypto_assets FROM 'tutorial_sample_assets.csv' CSV HEADER;
 \COPY crypto_ticks FROM 'tutorial_sample_tick.csv' CSV HEADER;
 
+-- ============================================================================
+-- ## Create Indexes
+-- ============================================================================
+-- Indexes are used to speed up the retrieval of data from a database table.
+-- In this case, you create an index on the symbol column of the crypto_assets 
+-- and crypto_ticks tables. Hypertables automatically create indexes on the 
+-- time column, so you don't need to create an index on that column.
+
+CREATE INDEX ON crypto_assets (symbol);
+CREATE INDEX ON crypto_ticks (symbol, time);
+
 -- ============================================================================
 -- ## Preview Data
 -- ============================================================================
@@ -70,18 +70,8 @@ CREATE TABLE sensor_data (
 );
 
 -- ============================================================================
--- ## Create Indexes
+-- ## Configure Sparse Indexes
 -- ============================================================================
--- Indexes are used to speed up the retrieval of data from a database table.
--- In this case, you create an index on the sensor_id column of the sensor_data table. 
--- Hypertables automatically create indexes on the 
--- time column, so you don't need to create an index on that column.
-
-CREATE INDEX ON sensor_data (sensor_id, time);
-
--- If you have sparse data, with columns that are often NULL, you can add a clause to the index, saying WHERE column IS NOT NULL.
--- This prevents the index from indexing NULL data, which can lead to a more compact and efficient index.
-
 -- Configurable sparse indexes
 -- lightweight metadata structures created on compressed chunks
 -- to allow efficient filtering without needing full B-tree indexes.
@@ -149,10 +139,26 @@ SELECT
   random()*100 AS temperature
 FROM generate_series(now() - interval '30 days', now(), interval '5 seconds') AS g1(time), generate_series(1,4,1) AS g2(sensor_id);
 
+-- ============================================================================
+-- ## Create Indexes
+-- ============================================================================
+-- Indexes are used to speed up the retrieval of data from a database table.
+-- In this case, you create an index on the sensor_id column of the sensor_data table. 
+-- Hypertables automatically create indexes on the 
+-- time column, so you don't need to create an index on that column.
+
+CREATE INDEX ON sensor_data (sensor_id, time);
+
+-- If you have sparse data, with columns that are often NULL, you can add a clause to the index, saying WHERE column IS NOT NULL.
+-- This prevents the index from indexing NULL data, which can lead to a more compact and efficient index.
+
+-- ============================================================================
 -- ## Load data from S3 - Optional
 -- ============================================================================
 -- Ingest IoT device data from S3 via Online S3 Connector
 --e.g. s3://dario-demo-data/sensor_data.csv
+-- If you use this ingest, run it before the Create Indexes step above, so
+-- CREATE INDEX ON sensor_data (sensor_id, time); runs after all data is loaded.
 
 ============================================================================
 -- ## Examine Hypertable Partitions